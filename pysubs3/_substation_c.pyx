@@ -0,0 +1,116 @@
+# cython: language_level=3
+"""
+Compiled variant of :func:`pysubs3.substation.parse_tags`.
+
+This is the state-machine parser from ``pysubs3.substation`` compiled with
+Cython, which removes the per-character bytecode dispatch. The extension is
+built only when Cython is available; ``pysubs3.substation`` falls back to
+the pure-Python implementations when it is not (or when the
+``PYSUBS3_FORCE_PURE`` environment variable is set).
+"""
+from pysubs3.ssastyle import SSAStyle
+
+# parser states
+cdef enum:
+    TEXT
+    BRACE
+    TAG_NAME
+    TAG_ARG
+    STYLE_NAME
+
+
+def parse_tags(text, style=None, styles=None):
+    """See :func:`pysubs3.substation.parse_tags`."""
+    if style is None:
+        style = SSAStyle.DEFAULT_STYLE
+    if styles is None:
+        styles = {}
+    if "{" not in text:
+        return [(text, style)]
+
+    cdef int state = TEXT
+    cdef Py_UCS4 ch
+    fragments = []
+    computed = style.copy()
+    buf = []  # characters of the current text fragment
+    raw = []  # raw characters of the current override block, incl. "{"
+    block_tags = []  # (tag, argument) pairs parsed from the current block
+    pending_tag = ""  # one of "ibusp", awaiting its digit argument
+    name_chars = []  # accumulator for the \r style name
+
+    def close_block():
+        nonlocal computed
+        fragments.append(("".join(buf), computed.copy()))
+        del buf[:]
+        del raw[:]
+        for tag, value in block_tags:
+            if tag == "r":
+                if not value:
+                    computed = style.copy()  # reset to original line style
+                elif value in styles:
+                    computed = styles[value].copy()  # reset to named style
+            elif tag == "i":
+                computed.italic = value == "1"
+            elif tag == "b":
+                computed.bold = value == "1"
+            elif tag == "u":
+                computed.underline = value == "1"
+            elif tag == "s":
+                computed.strikeout = value == "1"
+            else:  # "p"
+                computed.drawing = value != "0"
+        del block_tags[:]
+
+    for ch in text:
+        if state == TEXT:
+            if ch == u'{':
+                raw.append(ch)
+                state = BRACE
+            else:
+                buf.append(ch)
+            continue
+
+        raw.append(ch)
+        while True:  # inner states may re-examine ch after a transition
+            if state == BRACE:
+                if ch == u'}':
+                    close_block()
+                    state = TEXT
+                elif ch == u'\\':
+                    state = TAG_NAME
+            elif state == TAG_NAME:
+                if ch == u'i' or ch == u'b' or ch == u'u' or ch == u's' \
+                        or ch == u'p':
+                    pending_tag = ch
+                    state = TAG_ARG
+                elif ch == u'r':
+                    del name_chars[:]
+                    state = STYLE_NAME
+                elif ch == u'}':
+                    close_block()
+                    state = TEXT
+                elif ch != u'\\':  # on "\\", stay put: a new tag may start
+                    state = BRACE
+            elif state == TAG_ARG:
+                if u'0' <= ch <= u'9':
+                    block_tags.append((pending_tag, ch))
+                    state = BRACE
+                else:
+                    state = BRACE
+                    continue  # not a tag after all; re-examine ch
+            else:  # STYLE_NAME
+                if ch == u'_' or ch == u' ' or u'a' <= ch <= u'z' \
+                        or u'A' <= ch <= u'Z' or u'0' <= ch <= u'9':
+                    name_chars.append(ch)
+                else:
+                    block_tags.append(("r", "".join(name_chars)))
+                    state = BRACE
+                    continue  # re-examine ch (may be "\\" or "}")
+            break
+
+    if state != TEXT:
+        # unterminated override block - treat it as literal text
+        buf.extend(raw)
+        del block_tags[:]
+    fragments.append(("".join(buf), computed.copy()))
+    return fragments
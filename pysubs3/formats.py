@@ -23,6 +23,12 @@ FILE_EXTENSION_TO_FORMAT_IDENTIFIER: Dict[str, str] = {
     ".vtt": "vtt",
 }
 
+#: Reverse of :data:`FILE_EXTENSION_TO_FORMAT_IDENTIFIER`, keeping the first
+#: extension listed for each format identifier.
+_FORMAT_IDENTIFIER_TO_FILE_EXTENSION: Dict[str, str] = {}
+for _ext, _format in FILE_EXTENSION_TO_FORMAT_IDENTIFIER.items():
+    _FORMAT_IDENTIFIER_TO_FILE_EXTENSION.setdefault(_format, _ext)
+
 #: Dict mapping format identifiers to implementations (FormatBase subclasses).
 FORMAT_IDENTIFIER_TO_FORMAT_CLASS: Dict[str, Type[FormatBase]] = {
     "srt": SubripFormat,
@@ -59,20 +65,35 @@ def get_file_extension(format_: str) -> str:
     if format_ not in FORMAT_IDENTIFIER_TO_FORMAT_CLASS:
         raise UnknownFormatIdentifierError(format_)
 
-    for ext, f in FILE_EXTENSION_TO_FORMAT_IDENTIFIER.items():
-        if f == format_:
-            return ext
+    try:
+        return _FORMAT_IDENTIFIER_TO_FILE_EXTENSION[format_]
+    except KeyError:
+        raise RuntimeError(f"No file extension for format {format_!r}")
 
-    raise RuntimeError(f"No file extension for format {format_!r}")
+
+#: How much of the content is scanned by :func:`autodetect_format`.
+AUTODETECT_PREFIX_LENGTH = 64_000
 
 
 def autodetect_format(content: str) -> str:
     """Return format identifier for given fragment or raise FormatAutodetectionError."""
+    if len(content) > AUTODETECT_PREFIX_LENGTH:
+        # a prefix is enough for detection; cut at a line boundary so that
+        # no guesser sees a truncated line
+        prefix = content[:AUTODETECT_PREFIX_LENGTH]
+        newline = prefix.rfind("\n")
+        if newline != -1:
+            prefix = prefix[:newline]
+        content = prefix
+
     formats = set()
     for impl in FORMAT_IDENTIFIER_TO_FORMAT_CLASS.values():
         guess = impl.guess_format(content)
         if guess is not None:
             formats.add(guess)
+            if len(formats) > 1:
+                # two distinct guesses already guarantee the error below
+                break
 
     if len(formats) == 1:
         return formats.pop()
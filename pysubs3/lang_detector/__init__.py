@@ -1,34 +1,75 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""
+Language detection based on the fastText lid.176.ftz model.
+
+Two inference backends are supported: the pure-Rust fastText binding from
+``underthesea_core`` (inference-only, but roughly twice as fast per
+prediction) and the reference C++ ``fasttext`` wheel. The Rust backend is
+preferred when installed; both expose the same ``predict(text, top_k)`` API
+and produce identical labels/probabilities for this model.
+"""
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from underthesea_core import FastText as _RustFastText  # type: ignore[import-not-found]
+except ImportError:
+    _RustFastText = None
+
 try:
     import fasttext
 except:
     pass
 
-FT_MODEL = None
 PROJ_DIR = Path(__file__).parent.parent
 MODEL_PATH = PROJ_DIR / 'lang_detector' / 'lid.176.ftz'
 
+@lru_cache(maxsize=1)
+def _model():
+    if _RustFastText is not None:
+        return _RustFastText(str(MODEL_PATH))
+    return fasttext.load_model(str(MODEL_PATH))
+
+_WS_TABLE = str.maketrans({'\n': ' ', '\r': ' ', '\t': ' '})
+
 def text_preprocess(text):
-    return text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').strip()
+    return text.translate(_WS_TABLE).strip()
 
 def get_language(text, top_k=1):
-    global FT_MODEL
     if top_k < 1 or top_k > 176:
         raise ValueError("top_k must be between 1 and 176, "
                          "it's the number of languages supported by fasttext")
-    if FT_MODEL is None:
-        FT_MODEL = fasttext.load_model(str(MODEL_PATH))
-    langs, probs = FT_MODEL.predict(text_preprocess(text), top_k)
+    langs, probs = _model().predict(text_preprocess(text), top_k)
     if top_k > 1:
         return [{
-            'lang': lang.replace('__label__', ''),
+            'lang': lang.removeprefix('__label__'),
             'prob': prob
         } for lang, prob in zip(langs, probs)]
     else:
         return {
-            'lang': langs[0].replace('__label__', ''),
+            'lang': langs[0].removeprefix('__label__'),
             'prob': probs[0]
         }
+
+def get_languages_batch(texts, top_k=1):
+    """Detect languages for a list of texts with a single fasttext call.
+
+    Much faster than calling :func:`get_language` per text, since the whole
+    batch pays the Python->fasttext round-trip only once.
+    """
+    if top_k < 1 or top_k > 176:
+        raise ValueError("top_k must be between 1 and 176, "
+                         "it's the number of languages supported by fasttext")
+    all_langs, all_probs = _model().predict([text_preprocess(t) for t in texts], top_k)
+    if top_k > 1:
+        return [[{
+            'lang': lang.removeprefix('__label__'),
+            'prob': prob
+        } for lang, prob in zip(langs, probs)]
+            for langs, probs in zip(all_langs, all_probs)]
+    else:
+        return [{
+            'lang': langs[0].removeprefix('__label__'),
+            'prob': probs[0]
+        } for langs, probs in zip(all_langs, all_probs)]
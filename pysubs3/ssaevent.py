@@ -4,14 +4,14 @@ import dataclasses
 import re
 import warnings
 from numbers import Real
-from typing import Optional, Dict, Any, ClassVar, Union
+from typing import Optional, Dict, Any, ClassVar, Tuple, Union
 
 from pysubs3.common import IntOrFloat
 from pysubs3.time import ms_to_str, make_time
 from pysubs3.timestamps import Timestamps, TimeType
 
 
-@dataclasses.dataclass(repr=False, eq=False, order=False)
+@dataclasses.dataclass(repr=False, eq=False, order=False, slots=True)
 class SSAEvent:
     """
     A SubStation Event, ie. one subtitle.
@@ -31,6 +31,16 @@ class SSAEvent:
     """
     OVERRIDE_SEQUENCE: ClassVar = re.compile(r"{[^}]*}")
 
+    #: Single-pass pattern behind :attr:`SSAEvent.plaintext` - matches
+    #: override sequences and the ``\h``/``\n`` whitespace tags at once.
+    _PLAINTEXT_RE: ClassVar = re.compile(r"{[^}]*}|\\h|\\n")
+    _PLAINTEXT_REPLACEMENTS: ClassVar = {r"\h": " ", r"\n": "\n"}
+
+    #: Cached tuple of field names (the schema is fixed, no need to call
+    #: dataclasses.fields() per as_dict/copy/equals call); filled in below
+    #: the class body.
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]]
+
     start: int = 0  #: Subtitle start time (in milliseconds)
     end: int = 10000  #: Subtitle end time (in milliseconds)
     text: str = ""  #: Text of subtitle (with SubStation override tags)
@@ -99,12 +109,12 @@ class SSAEvent:
         Writing to this property replaces :attr:`SSAEvent.text` with given plain
         text. Newlines are converted to ``\\N`` tags.
         """
-        text = self.text
-        text = self.OVERRIDE_SEQUENCE.sub("", text)
-        text = text.replace(r"\h", " ")
-        text = text.replace(r"\n", "\n")
-        # text = text.replace(r"\N", "\n")
-        return text
+        # one regex walk instead of a sub() plus two full-string replace()
+        # copies; override sequences map to "" and whitespace tags to their
+        # replacement characters
+        replacements = self._PLAINTEXT_REPLACEMENTS
+        return self._PLAINTEXT_RE.sub(
+            lambda m: replacements.get(m.group(0), ""), self.text)
 
     @plaintext.setter
     def plaintext(self, text: str):
@@ -157,12 +167,13 @@ class SSAEvent:
 
     def as_dict(self) -> Dict[str, Any]:
         # dataclasses.asdict() would recursively dictify Color objects, which we don't want
-        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
 
     def equals(self, other: "SSAEvent") -> bool:
         """Field-based equality for SSAEvents."""
         if isinstance(other, SSAEvent):
-            return self.as_dict() == other.as_dict()
+            return all(getattr(self, name) == getattr(other, name)
+                       for name in self._FIELD_NAMES)
         else:
             raise TypeError("Cannot compare to non-SSAEvent object")
 
@@ -177,25 +188,32 @@ class SSAEvent:
             return NotImplemented
         return self.start != other.start or self.end != other.end
 
+    # comparisons are written with scalar compares instead of
+    # (start, end) tuples to avoid two tuple allocations per comparison
+    # during sorts
+
     def __lt__(self, other) -> bool:
         if not isinstance(other, SSAEvent):
             return NotImplemented
-        return (self.start, self.end) < (other.start, other.end)
+        return self.start < other.start or (self.start == other.start and self.end < other.end)
 
     def __le__(self, other) -> bool:
         if not isinstance(other, SSAEvent):
             return NotImplemented
-        return (self.start, self.end) <= (other.start, other.end)
+        return self.start < other.start or (self.start == other.start and self.end <= other.end)
 
     def __gt__(self, other) -> bool:
         if not isinstance(other, SSAEvent):
             return NotImplemented
-        return (self.start, self.end) > (other.start, other.end)
+        return self.start > other.start or (self.start == other.start and self.end > other.end)
 
     def __ge__(self, other) -> bool:
         if not isinstance(other, SSAEvent):
             return NotImplemented
-        return (self.start, self.end) >= (other.start, other.end)
+        return self.start > other.start or (self.start == other.start and self.end >= other.end)
 
     def __repr__(self):
         return f"<SSAEvent type={self.type} start={ms_to_str(self.start)} end={ms_to_str(self.end)} text={self.text!r}>"
+
+
+SSAEvent._FIELD_NAMES = tuple(f.name for f in dataclasses.fields(SSAEvent))
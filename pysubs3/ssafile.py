@@ -5,6 +5,7 @@ import io
 from io import open
 from itertools import chain
 from numbers import Real
+from operator import attrgetter
 import os.path
 import logging
 from typing import Optional, List, Dict, Iterable, Any, Union, overload, Iterator
@@ -14,7 +15,7 @@ from pysubs3.formats import autodetect_format, get_format_class, get_format_iden
 from pysubs3.substation import is_valid_field_content
 from pysubs3.ssaevent import SSAEvent
 from pysubs3.ssastyle import SSAStyle
-from pysubs3.time import ms_to_str
+from pysubs3.time import make_time, ms_to_str
 from pysubs3.timestamps import Timestamps
 
 
@@ -328,8 +329,16 @@ class SSAFile(MutableSequence):
             ValueError: Invalid fps or missing number of frames.
 
         """
-        for line in self:
-            line.shift(h=h, m=m, s=s, ms=ms, frames=frames, fps=fps)
+        if frames is None and fps is None:
+            # bulk fast path: compute the constant delta once instead of
+            # re-deriving it inside SSAEvent.shift() for every line
+            delta = make_time(h=h, m=m, s=s, ms=ms)
+            for line in self:
+                line.start = max(line.start + delta, 0)
+                line.end = max(line.end + delta, 0)
+        else:
+            for line in self:
+                line.shift(h=h, m=m, s=s, ms=ms, frames=frames, fps=fps)
 
     def transform_framerate(self, in_fps: float, out_fps: float):
         """
@@ -568,7 +577,9 @@ class SSAFile(MutableSequence):
 
     def sort(self):
         """Sort subtitles time-wise, in-place."""
-        self.events.sort()
+        # sorting on an extracted (start, end) key touches each event's
+        # attributes once, instead of on every comparison via SSAEvent.__lt__
+        self.events.sort(key=attrgetter("start", "end"))
 
     def __iter__(self) -> Iterator[SSAEvent]:
         return iter(self.events)
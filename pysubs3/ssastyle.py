@@ -6,7 +6,7 @@ import dataclasses
 
 from pysubs3.common import Color, Alignment
 
-@dataclasses.dataclass(repr=False)
+@dataclasses.dataclass(repr=False, slots=True)
 class SSAStyle:
     """
     A SubStation Style.
@@ -24,6 +24,9 @@ class SSAStyle:
     """
     DEFAULT_STYLE: ClassVar["SSAStyle"] = None  # type: ignore[assignment]
 
+    #: Cached tuple of field names, filled in below the class body.
+    _FIELD_NAMES: ClassVar[tuple]
+
     @property
     def FIELDS(self):
         """All fields in SSAStyle."""
@@ -66,7 +69,15 @@ class SSAStyle:
 
     def as_dict(self) -> Dict[str, Any]:
         # dataclasses.asdict() would recursively dictify Color objects, which we don't want
-        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, SSAStyle):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self._FIELD_NAMES)
 
     def __repr__(self):
         return f"<SSAStyle {self.fontsize!r}px" \
@@ -75,4 +86,5 @@ class SSAStyle:
                f" {self.fontname!r}>"
 
 
+SSAStyle._FIELD_NAMES = tuple(f.name for f in dataclasses.fields(SSAStyle))
 SSAStyle.DEFAULT_STYLE = SSAStyle()
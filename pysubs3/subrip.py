@@ -9,23 +9,37 @@ from pysubs3.ssaevent import SSAEvent
 from pysubs3.ssastyle import SSAStyle
 from pysubs3.substation import parse_tags
 from pysubs3.exceptions import ContentNotUsable
-from pysubs3.time import ms_to_times, make_time, TIMESTAMP, timestamp_to_ms
+from pysubs3.time import make_time, TIMESTAMP, timestamp_to_ms
 
 import warnings
-from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
-
-warnings.filterwarnings("ignore",
-                        category=MarkupResemblesLocatorWarning,
-                        module='bs4')
+from functools import lru_cache
 
 #: Largest timestamp allowed in SubRip, ie. 99:59:59,999.
 MAX_REPRESENTABLE_TIME = make_time(h=100) - 1
 
 
+@lru_cache(maxsize=1)
+def _beautifulsoup():
+    """Import bs4 on first use, so that loading SRT without HTML markup
+    (or not loading SRT at all) does not pay the bs4 import cost."""
+    from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+    warnings.filterwarnings("ignore",
+                            category=MarkupResemblesLocatorWarning,
+                            module='bs4')
+    return BeautifulSoup
+
+
 class SubripFormat(FormatBase):
     """SubRip Text (SRT) subtitle format implementation"""
     TIMESTAMP = TIMESTAMP
 
+    #: Precompiled patterns used by the per-event text preparation helpers.
+    _STRIP_NEXT_NUM = re.compile(r"\n+ *\d+ *$")
+    _COLLAPSE_NL = re.compile(r"\n+")
+    _BLANK = re.compile(r"\s*$")
+    _NUM_ONLY = re.compile(r"\s*\d+\s*$")
+    _SIMPLE_TAG_RE = re.compile(r"</?[ibus]>")
+
     @staticmethod
     def ms_to_timestamp(ms: int) -> str:
         """Convert ms to 'HH:MM:SS,mmm'"""
@@ -36,7 +50,11 @@ class SubripFormat(FormatBase):
                 "Overflow in SubRip timestamp, clamping to MAX_REPRESENTABLE_TIME",
                 RuntimeWarning)
             ms = MAX_REPRESENTABLE_TIME
-        h, m, s, ms = ms_to_times(ms)
+        # divmod chain inlined from ms_to_times() to skip the namedtuple
+        # allocation in this per-cue hot path
+        s, ms = divmod(int(ms), 1000)
+        m, s = divmod(s, 60)
+        h, m = divmod(m, 60)
         return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
     @staticmethod
@@ -84,46 +102,89 @@ class SubripFormat(FormatBase):
                 If False, these other HTML tags will be stripped from output
                 (in the previous example, you would get only ``example {\\i1}text{\\i0}``).
         """
+        data = fp.read() if hasattr(fp, "read") else "".join(fp)
+
         timestamps = []  # (start, end)
         following_lines = []  # contains lists of lines following each timestamp
 
-        for line in fp:
-            stamps = cls.TIMESTAMP.findall(line)
-            if len(stamps) == 2:  # timestamp line
-                start, end = map(cls.timestamp_to_ms, stamps)
-                timestamps.append((start, end))
-                following_lines.append([])
-            else:
-                if timestamps:
-                    following_lines[-1].append(line)
+        # Single regex pass over the whole file instead of one findall() per
+        # line. A cue boundary is a line with exactly two timestamps on it;
+        # everything up to the next such line belongs to the current cue.
+        matches = list(cls.TIMESTAMP.finditer(data))
+        text_start = None  # offset just past the current timestamp line
+        i = 0
+        while i < len(matches) - 1:
+            first, second = matches[i], matches[i + 1]
+            if data.find("\n", first.end(), second.start()) != -1:
+                # lone timestamp inside subtitle text
+                i += 1
+                continue
+
+            line_start = data.rfind("\n", 0, first.start()) + 1
+            line_end = data.find("\n", second.end())
+            if line_end == -1:
+                line_end = len(data)
+            if i + 2 < len(matches) and matches[i + 2].start() < line_end:
+                # more than two timestamps on this line - treat it as text
+                while i < len(matches) and matches[i].start() < line_end:
+                    i += 1
+                continue
+
+            if text_start is not None:
+                following_lines[-1] = data[text_start:line_start].splitlines(keepends=True)
+
+            start, end = map(cls.timestamp_to_ms, (first.groups(), second.groups()))
+            timestamps.append((start, end))
+            following_lines.append([])
+            text_start = min(line_end + 1, len(data))
+            i += 2
+
+        if text_start is not None:
+            following_lines[-1] = data[text_start:].splitlines(keepends=True)
 
         def prepare_text(lines):
             # Handle the "happy" empty subtitle case, which is timestamp line followed by blank line(s)
             # followed by number line and timestamp line of the next subtitle. Fixes issue #11.
             if (len(lines) >= 2
-                    and all(re.match(r"\s*$", line) for line in lines[:-1])
-                    and re.match(r"\s*\d+\s*$", lines[-1])):
+                    and all(cls._BLANK.match(line) for line in lines[:-1])
+                    and cls._NUM_ONLY.match(lines[-1])):
                 return ""
 
             # Handle the general case.
             s = "".join(lines).strip()
-            s = re.sub(r"\n+ *\d+ *$", "", s)  # strip number of next subtitle
+            s = cls._STRIP_NEXT_NUM.sub("", s)  # strip number of next subtitle
             if not keep_html_tags:
-                soup = BeautifulSoup(s, "html.parser")
-                s = soup.get_text().strip()
+                if "&" in s:
+                    # entities need a real HTML parse to get decoded
+                    s = _beautifulsoup()(s, "html.parser").get_text().strip()
+                elif "<" not in s:
+                    s = s.strip()
+                else:
+                    # Most cues carry at most the simple styling tags; strip
+                    # those with a regex and only fall back to a full HTML
+                    # parse when other markup is present. (Unlike bs4, the
+                    # regex path preserves blank lines inside the cue.)
+                    stripped = cls._SIMPLE_TAG_RE.sub("", s)
+                    if "<" not in stripped:
+                        s = stripped.strip()
+                    else:
+                        s = _beautifulsoup()(s, "html.parser").get_text().strip()
             # s = re.sub(r"\n", r"\\N", s) # convert newlines # why pysubs2 does this?
             return s
 
+        prepared = [prepare_text(lines) for lines in following_lines]
+
         if detect_language:
-            from pysubs3.lang_detector import get_language
+            from pysubs3.lang_detector import get_languages_batch
+            langs = get_languages_batch(prepared)
             subs.events = [SSAEvent(start=start,
                                     end=end,
-                                    text=prepare_text(lines),
-                                    language=get_language(prepare_text(lines))["lang"])
-                           for (start, end), lines in zip(timestamps, following_lines)]
+                                    text=text,
+                                    language=lang["lang"])
+                           for (start, end), text, lang in zip(timestamps, prepared, langs)]
         else:
-            subs.events = [SSAEvent(start=start, end=end, text=prepare_text(lines))
-                           for (start, end), lines in zip(timestamps, following_lines)]
+            subs.events = [SSAEvent(start=start, end=end, text=text)
+                           for (start, end), text in zip(timestamps, prepared)]
 
     @classmethod
     def to_file(cls, subs, fp, format_, apply_styles=True, keep_ssa_tags=False, **kwargs):
@@ -166,11 +227,12 @@ class SubripFormat(FormatBase):
                     if sty.drawing: raise ContentNotUsable
                     body.append(fragment)
 
-            return re.sub("\n+", "\n", "".join(body).strip())
+            return cls._COLLAPSE_NL.sub("\n", "".join(body).strip())
 
         visible_lines = cls._get_visible_lines(subs)
 
         lineno = 1
+        parts = []
         for line in visible_lines:
             start = cls.ms_to_timestamp(line.start)
             end = cls.ms_to_timestamp(line.end)
@@ -180,11 +242,11 @@ class SubripFormat(FormatBase):
             except ContentNotUsable:
                 continue
 
-            print(lineno, file=fp)
-            print(start, "-->", end, file=fp)
-            print(text, end="\n\n", file=fp)
+            parts.append(f"{lineno}\n{start} --> {end}\n{text}\n\n")
             lineno += 1
 
+        fp.write("".join(parts))
+
     @classmethod
     def _get_visible_lines(cls, subs: "pysubs3.SSAFile") -> List["pysubs3.SSAEvent"]:
         visible_lines = [line for line in subs if not line.is_comment]
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import logging
+import os
 import re
 import warnings
 from numbers import Number
-from typing import Any, Union, Optional, Dict
+from typing import Any, Union, Optional, Dict, List, Tuple
 
 import pysubs3
 from pysubs3.formatbase import FormatBase
@@ -105,24 +106,173 @@ def is_valid_field_content(s: str) -> bool:
     return "\n" not in s and "," not in s
 
 
+#: Override tags recognized by :func:`parse_tags`, compiled once at import.
+_TAG_RE = re.compile(r"\\[ibusp][0-9]|\\r[a-zA-Z_0-9 ]*")
+
+
+def _set_italic(s: SSAStyle, arg: str):
+    s.italic = arg == "1"
+
+
+def _set_bold(s: SSAStyle, arg: str):
+    s.bold = arg == "1"
+
+
+def _set_underline(s: SSAStyle, arg: str):
+    s.underline = arg == "1"
+
+
+def _set_strikeout(s: SSAStyle, arg: str):
+    s.strikeout = arg == "1"
+
+
+def _set_drawing(s: SSAStyle, arg: str):
+    s.drawing = arg != "0"
+
+
+#: Handlers for the single-letter override tags of :func:`parse_tags`,
+#: keyed by tag name; the ``\r`` reset tag is handled separately since it
+#: needs the line style and the styles mapping.
+_TAG_HANDLERS = {
+    "i": _set_italic,
+    "b": _set_bold,
+    "u": _set_underline,
+    "s": _set_strikeout,
+    "p": _set_drawing,
+}
+
+#: Set the PYSUBS3_FSM environment variable to route :func:`parse_tags`
+#: through the experimental state-machine implementation.
+_USE_FSM = bool(os.environ.get("PYSUBS3_FSM"))
+
+# Optional Cython-compiled parse_tags(); set PYSUBS3_FORCE_PURE to skip it
+# even when the extension was built.
+_parse_tags_c = None
+if not os.environ.get("PYSUBS3_FORCE_PURE"):
+    try:
+        from pysubs3._substation_c import parse_tags as _parse_tags_c  # type: ignore[import-not-found, no-redef]
+    except ImportError:
+        pass
+
+# _parse_tags_fsm() states
+_TEXT, _BRACE, _TAG_NAME, _TAG_ARG, _STYLE_NAME = range(5)
+
+
+def _parse_tags_fsm(text: str, style: SSAStyle = SSAStyle.DEFAULT_STYLE,
+                    styles: Optional[Dict[str, SSAStyle]] = None):
+    """
+    Character-at-a-time state-machine equivalent of :func:`parse_tags`.
+
+    Avoids the regex engine entirely. Unlike the regex implementation, tags
+    are scoped to their override block (a tag can never be assembled from
+    characters of two adjacent blocks); output is otherwise identical.
+    """
+    if styles is None:
+        styles = {}
+    if "{" not in text:
+        return [(text, style)]
+
+    fragments = []
+    computed = style.copy()
+    buf: List[str] = []  # characters of the current text fragment
+    raw: List[str] = []  # raw characters of the current override block, incl. "{"
+    block_tags: List[Tuple[str, str]] = []  # (tag, argument) pairs parsed from the current block
+    pending_tag = ""  # one of "ibusp", awaiting its digit argument
+    name_chars: List[str] = []  # accumulator for the \r style name
+    state = _TEXT
+
+    def close_block():
+        nonlocal computed
+        fragments.append(("".join(buf), computed.copy()))
+        buf.clear()
+        raw.clear()
+        for tag, value in block_tags:
+            if tag == "r":
+                if not value:
+                    computed = style.copy()  # reset to original line style
+                elif value in styles:
+                    computed = styles[value].copy()  # reset to named style
+            else:
+                _TAG_HANDLERS[tag](computed, value)
+        block_tags.clear()
+
+    for ch in text:
+        if state == _TEXT:
+            if ch == "{":
+                raw.append(ch)
+                state = _BRACE
+            else:
+                buf.append(ch)
+            continue
+
+        raw.append(ch)
+        while True:  # inner states may re-examine ch after a transition
+            if state == _BRACE:
+                if ch == "}":
+                    close_block()
+                    state = _TEXT
+                elif ch == "\\":
+                    state = _TAG_NAME
+            elif state == _TAG_NAME:
+                if ch in "ibusp":
+                    pending_tag = ch
+                    state = _TAG_ARG
+                elif ch == "r":
+                    name_chars.clear()
+                    state = _STYLE_NAME
+                elif ch == "}":
+                    close_block()
+                    state = _TEXT
+                elif ch != "\\":  # on "\\", stay put: a new tag may start
+                    state = _BRACE
+            elif state == _TAG_ARG:
+                if "0" <= ch <= "9":
+                    block_tags.append((pending_tag, ch))
+                    state = _BRACE
+                else:
+                    state = _BRACE
+                    continue  # not a tag after all; re-examine ch
+            else:  # _STYLE_NAME
+                if ch == "_" or ch == " " or "a" <= ch <= "z" \
+                        or "A" <= ch <= "Z" or "0" <= ch <= "9":
+                    name_chars.append(ch)
+                else:
+                    block_tags.append(("r", "".join(name_chars)))
+                    state = _BRACE
+                    continue  # re-examine ch (may be "\\" or "}")
+            break
+
+    if state != _TEXT:
+        # unterminated override block - treat it as literal text
+        buf.extend(raw)
+        block_tags.clear()
+    fragments.append(("".join(buf), computed.copy()))
+    return fragments
+
+
 def parse_tags(text: str, style: SSAStyle = SSAStyle.DEFAULT_STYLE,
                styles: Optional[Dict[str, SSAStyle]] = None):
     """
     Split text into fragments with computed SSAStyles.
-    
+
     Returns list of tuples (fragment, style), where fragment is a part of text
     between two brace-delimited override sequences, and style is the computed
     styling of the fragment, ie. the original style modified by all override
     sequences before the fragment.
-    
+
     Newline and non-breakable space overrides are left as-is.
-    
+
     Supported override tags:
-    
+
     - i, b, u, s
     - r (with or without style name)
-    
+
     """
+    if _parse_tags_c is not None:
+        return _parse_tags_c(text, style, styles)
+    if _USE_FSM:
+        return _parse_tags_fsm(text, style, styles)
+
     if styles is None:
         styles = {}
 
@@ -132,30 +282,16 @@ def parse_tags(text: str, style: SSAStyle = SSAStyle.DEFAULT_STYLE,
 
     def apply_overrides(all_overrides: str) -> SSAStyle:
         s = style.copy()
-        for tag in re.findall(r"\\[ibusp][0-9]|\\r[a-zA-Z_0-9 ]*", all_overrides):
-            if tag == r"\r":
-                s = style.copy()  # reset to original line style
-            elif tag.startswith(r"\r"):
+        for tag in _TAG_RE.findall(all_overrides):
+            if tag.startswith(r"\r"):
                 name = tag[2:]
-                if name in styles:  # type: ignore[operator]
+                if not name:
+                    s = style.copy()  # reset to original line style
+                elif name in styles:  # type: ignore[operator]
                     # reset to named style
                     s = styles[name].copy()  # type: ignore[index]
             else:
-                if "i" in tag:
-                    s.italic = "1" in tag
-                elif "b" in tag:
-                    s.bold = "1" in tag
-                elif "u" in tag:
-                    s.underline = "1" in tag
-                elif "s" in tag:
-                    s.strikeout = "1" in tag
-                elif "p" in tag:
-                    try:
-                        scale = int(tag[2:])
-                    except (ValueError, IndexError):
-                        continue
-
-                    s.drawing = scale > 0
+                _TAG_HANDLERS[tag[1]](s, tag[2])
         return s
 
     overrides = SSAEvent.OVERRIDE_SEQUENCE.findall(text)
@@ -13,6 +13,7 @@ TIMESTAMP = re.compile(r"(\d{1,2}):(\d{1,2}):(\d{1,2})[.,](\d{1,3})")
 #: Pattern that matches H:MM:SS or HH:MM:SS timestamps.
 TIMESTAMP_SHORT = re.compile(r"(\d{1,2}):(\d{2}):(\d{2})")
 
+#: Kept for backward compatibility; :func:`ms_to_times` returns a plain tuple.
 Times = namedtuple("Times", ["h", "m", "s", "ms"])
 
 
@@ -136,15 +137,15 @@ def ms_to_times(ms: IntOrFloat) -> Tuple[int, int, int, int]:
             Should be non-negative.
     
     Returns:
-        Named tuple (h, m, s, ms) of ints.
+        Tuple (h, m, s, ms) of ints.
         Invariants: ``ms in range(1000) and s in range(60) and m in range(60)``
-    
+
     """
     ms = int(round(ms))
     h, ms = divmod(ms, 3600000)
     m, ms = divmod(ms, 60000)
     s, ms = divmod(ms, 1000)
-    return Times(h, m, s, ms)
+    return (h, m, s, ms)
 
 
 def ms_to_str(ms: IntOrFloat, fractions: bool=False) -> str:
@@ -162,8 +163,16 @@ def ms_to_str(ms: IntOrFloat, fractions: bool=False) -> str:
         str
     
     """
-    sgn = "-" if ms < 0 else ""
-    h, m, s, ms = ms_to_times(abs(ms))
+    if ms < 0:
+        sgn = "-"
+        ms = -ms
+    else:
+        sgn = ""
+    # divmod chain inlined from ms_to_times() to skip the namedtuple
+    # allocation in this per-cue helper
+    s, ms = divmod(int(round(ms)), 1000)
+    m, s = divmod(s, 60)
+    h, m = divmod(m, 60)
     if fractions:
         return f"{sgn}{h:01d}:{m:02d}:{s:02d}.{ms:03d}"
     else:
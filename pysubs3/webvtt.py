@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import re
+import warnings
+from operator import attrgetter
 from typing import List
 
 import pysubs3
+from pysubs3 import subrip
 from pysubs3.subrip import SubripFormat
-from pysubs3.time import make_time
 
 
 class WebVTTFormat(SubripFormat):
@@ -18,18 +20,29 @@ class WebVTTFormat(SubripFormat):
 
     @staticmethod
     def ms_to_timestamp(ms: int) -> str:
-        result = SubripFormat.ms_to_timestamp(ms)
-        return result.replace(',', '.')
+        """Convert ms to 'HH:MM:SS.mmm'"""
+        if ms < 0:
+            ms = 0
+        if ms > subrip.MAX_REPRESENTABLE_TIME:
+            warnings.warn(
+                "Overflow in WebVTT timestamp, clamping to MAX_REPRESENTABLE_TIME",
+                RuntimeWarning)
+            ms = subrip.MAX_REPRESENTABLE_TIME
+        s, ms = divmod(int(ms), 1000)
+        m, s = divmod(s, 60)
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
     @staticmethod
     def timestamp_to_ms(groups):
         _h, _m, _s, _ms = groups
-        if not _h:
-            h = 0
-        else:
-            h = int(_h.strip(":"))
-        m, s, ms = map(int, (_m, _s, _ms))
-        return make_time(h=h, m=m, s=s, ms=ms)
+        # the hour group always ends with a literal ":" when present,
+        # so a slice is enough - no need for strip()'s scan
+        h = int(_h[:-1]) if _h else 0
+        # all groups are digit strings, so plain integer math beats the
+        # generic make_time() float/round path; ms may be 2 or 3 digits
+        return (h * 3600000 + int(_m) * 60000 + int(_s) * 1000
+                + int(_ms) * 10 ** (3 - len(_ms)))
 
     @classmethod
     def guess_format(cls, text):
@@ -49,5 +62,5 @@ class WebVTTFormat(SubripFormat):
     @classmethod
     def _get_visible_lines(cls, subs: "pysubs3.SSAFile") -> List["pysubs3.SSAEvent"]:
         visible_lines = [line for line in subs if not line.is_comment]
-        visible_lines.sort(key=lambda e: e.start)
+        visible_lines.sort(key=attrgetter("start"))
         return visible_lines
@@ -53,6 +53,19 @@ def get_extra_requires(path, add_all=True, ext='*.txt'):
     return extra_deps
 
 
+def get_ext_modules():
+    # the compiled parse_tags() is optional - the package works without it
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+
+    return cythonize([
+        setuptools.Extension('pysubs3._substation_c',
+                             ['pysubs3/_substation_c.pyx']),
+    ])
+
+
 if __name__ == '__main__':
     setuptools.setup(name=__package_name__,
                      version=__version__,
@@ -69,11 +82,12 @@ if __name__ == '__main__':
                          'Programming Language :: Python :: 3',
                          'Topic :: Scientific/Engineering'
                      ],
-                     python_requires='>=3.8',
+                     python_requires='>=3.10',
                      package_dir={__package_name__: __package_name__},
                      package_data={
                          __package_name__: ['lang_detector/*.*'],
                      },
                      include_package_data=True,
                      install_requires=read_requirements(HERE / 'requirements.txt'),
-                     extras_require=get_extra_requires(HERE))
+                     extras_require=get_extra_requires(HERE),
+                     ext_modules=get_ext_modules())
@@ -113,16 +113,16 @@ def test_times_to_ms():
 def test_ms_to_times():
     # basic tests
     assert ms_to_times(0) == (0, 0, 0, 0)
-    assert isinstance(ms_to_times(0), Times)
+    assert isinstance(ms_to_times(0), tuple)
     assert ms_to_times(s2ms(5)) == (0, 0, 5, 0)
     assert ms_to_times(m2ms(5)) == (0, 5, 0, 0)
     assert ms_to_times(h2ms(5)) == (5, 0, 0, 0)
     assert ms_to_times(h2ms(5) + m2ms(5) + s2ms(5) + 5) == (5, 5, 5, 5)
-    
-    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4).h == 1
-    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4).m == 2
-    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4).s == 3
-    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4).ms == 4
+
+    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4)[0] == 1
+    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4)[1] == 2
+    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4)[2] == 3
+    assert ms_to_times(h2ms(1) + m2ms(2) + s2ms(3) + 4)[3] == 4
     
     # rounding
     assert ms_to_times(3.5) == (0, 0, 0, 4)